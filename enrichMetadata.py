@@ -10,38 +10,92 @@ by creating additional attributes.
 
 import pandas as pd
 import numpy as np
+import orjson
 import re
 from datetime import datetime
 from ast import literal_eval
 
 
+# Regular expressions used per dossier are compiled once at import time
+_RE_COLON = re.compile(r":")
+_RE_ADDR_NUM_END = re.compile(r"^([A-Za-zäöü.\-\s]+[0-9]+[a-z]?)$")
+_RE_HOUSENUM_SUFFIX = re.compile(r"([0-9]+[a-z]?)$")
+_RE_ANY_NUM = re.compile(r"([0-9]+[a-z]?)")
+
+_RE_BANN = re.compile(r"[Bb]ann")
+_RE_SIMPLE_NUMBERS = re.compile(r"^([0-9]+\s?[a-zA-Z]?(,\s|\s/\s|\s\+\s|\su\.\s)?)+$")
+_RE_SIMPLE_NUMBERS_SPLIT = re.compile(r",\s|\s/\s|\s\+\s|\su\.\s")
+_RE_BANN_POSTFIX = re.compile(r"^([0-9]+\s?[a-zA-Z]?(,\s|\s/\s)?)+\s\(Bann\)$")
+_RE_BANN_POSTFIX_SPLIT = re.compile(r",\s|\s/\s|\s\(Bann\)")
+_RE_ARBITRARY_POSTFIX = re.compile(r"^[0-9]+\s?[a-zA-Z]?.+$")
+_RE_ARBITRARY_POSTFIX_NUMBER = re.compile(r"^[0-9]+\s?([a-zA-Z](\s|,))?")
+_RE_TRAILING_SEPARATOR = re.compile(r",$|\s$")
+_RE_PART_OF = re.compile(
+    r"^(Th. v.|Theil von|Theil v.|Th. von)\s([0-9]+\s?[a-zA-Z]?(,\s)*)+(\sneben)?\s?[0-9]*\s?[a-zA-Z]?$")
+_RE_PART_OF_SPLIT = re.compile(r"Th. v.\s|Theil von\s|Theil v.\s|Th. von\s|\sneben\s|,\s")
+_RE_NEBEN = re.compile(r"neben")
+_RE_PART_OF_POSTFIX = re.compile(r"^(Th. v.|Theil von|Theil v.|Th. von)\s[0-9]+\s?[a-zA-Z]?.+$")
+_RE_PART_OF_POSTFIX_SPLIT = re.compile(r"Th. v.\s|Theil von\s|Theil v.\s|Th. von\s|,\s|\s")
+_RE_PART_OF_NEIGHBOUR = re.compile(r"^(Th. v.|Theil von|Theil v.|Th. von)\s[0-9]+\s?[a-zA-Z]?\sneben\s[0-9]+")
+_RE_WHITESPACE = re.compile(r"\s")
+
+# All formats of old house numbers handled by split_old_house_number combined in one pattern. The alternatives are
+# tried in the given order, the name of the matching group tells the detected format.
+_RE_OLD_HOUSENUMBER_FORMAT = re.compile("|".join(f"(?P<{name}>{regex.pattern})" for name, regex in [
+    ('simple_numbers', _RE_SIMPLE_NUMBERS),
+    ('bann_postfix', _RE_BANN_POSTFIX),
+    ('arbitrary_postfix', _RE_ARBITRARY_POSTFIX),
+    ('part_of', _RE_PART_OF),
+    ('part_of_postfix', _RE_PART_OF_POSTFIX)]))
+
+
 def get_new_house_number(dossier_title):
     # Given a dossier title, returns the extracted house number
     
     # Exclude titles containing ":" that are usually are no addresses, for example "Kanonengasse: Übersicht" 
-    address_match = re.search(r":", dossier_title)
+    address_match = _RE_COLON.search(dossier_title)
     if address_match:
         return None
 
     # Search simple adress pattern with housenumber at the end, for example "St. Johanns-Vorstadt 2"
-    address_match = re.match(r"[A-Za-zäöü.\-\s]+[0-9]+[a-z]?$", dossier_title)
+    address_match = _RE_ADDR_NUM_END.match(dossier_title)
     if address_match:
         address = address_match.group()
         address_split = address.split(' ')
         # Case if no whitespace is existing, e.g. "Malzgasse10"
         if len(address_split) == 1:
-            house_number = re.search(r"[0-9]+[a-z]?$", address)
+            house_number = _RE_HOUSENUM_SUFFIX.search(address)
             return house_number.group()
         return address_split[-1]
     
     # Search first appearance of a number, for example "St. Johanns-Vorstadt 8, 10". Else, return None.
-    house_number = re.search(r"[0-9]+[a-z]?", dossier_title)
+    house_number = _RE_ANY_NUM.search(dossier_title)
     if house_number:
         return house_number.group()
     else:
         return None
 
 
+def get_new_house_numbers(dossier_titles):
+    # Vectorized version of get_new_house_number for a series of dossier titles
+
+    # Exclude titles containing ":"
+    has_colon = dossier_titles.str.contains(':', regex=False, na=False)
+
+    # Simple adress pattern with housenumber at the end, the house number is the last word of the address
+    address = dossier_titles.str.extract(_RE_ADDR_NUM_END, expand=False)
+    address_number = address.str.split(' ').str[-1]
+    # Case if no whitespace is existing, e.g. "Malzgasse10"
+    no_whitespace = address.notna() & ~address.str.contains(' ', regex=False, na=False)
+    address_number[no_whitespace] = address[no_whitespace].str.extract(_RE_HOUSENUM_SUFFIX, expand=False)
+
+    # First appearance of a number for all other titles
+    any_number = dossier_titles.str.extract(_RE_ANY_NUM, expand=False)
+
+    house_numbers = np.where(has_colon, None, np.where(address.notna(), address_number, any_number))
+    return pd.Series(house_numbers, index=dossier_titles.index, dtype=object)
+
+
 def split_old_house_number(old_house_number, new_house_number):
     """Given an old house number as string, returns a pandas series with the following values:
     - oldHousenumberNumber: guess of the old house number
@@ -54,99 +108,87 @@ def split_old_house_number(old_house_number, new_house_number):
     if pd.isna(old_house_number):
         return pd.Series([None, None, None, None, None])
 
-    is_bann = False
-
-    while True:
-        # Detect old house humbers from "Bann"
-        bann_match = re.search(r"(Bann)|(bann)", old_house_number)
-        if bann_match:
-            is_bann = True
-
-        # Search simple numbers like "1257" and "1257 A" as well as multiple simple numbers
-        # like "1052, 1053, 1054", "1097 / 1096", "827 + 827 A", "1250 u. 1251"
-        number_match = re.match(r"^([0-9]+\s?[a-zA-Z]?(,\s|\s/\s|\s\+\s|\su\.\s)?)+$", old_house_number)
-        if number_match:
-            number_split = re.split(r",\s|\s/\s|\s\+\s|\su\.\s", old_house_number)
-            result = pd.Series([number_split, None, None, False, is_bann])
-            break
-        
-        # Search for numbers with postfix " (Bann)", for example "48 A (Bann)"
-        number_match = re.match(r"^([0-9]+\s?[a-zA-Z]?(,\s|\s/\s)?)+\s\(Bann\)$", old_house_number)
-        if number_match:
-            number_split = re.split(r",\s|\s/\s|\s\(Bann\)", old_house_number)
-            result = pd.Series([number_split[:-1], None, None, False, is_bann])
-            break
-    
-        # Search for numbers with arbitrary postfix, for example "441 A u. Th. v. 440 neben 441 A"
-        number_match = re.match(r"^[0-9]+\s?[a-zA-Z]?.+$", old_house_number)
-        if number_match:
-            number = re.search(r"^[0-9]+\s?([a-zA-Z](\s|,))?", old_house_number).group()
-            supplement = old_house_number[len(number):]
-            if re.search(r",$|\s$", number):
-                number = number[:-1]
-            result = pd.Series([[number], supplement, None, False, is_bann])
-            break
-        
-        # Search for numbers with prefix "Th. v.", "Theil von", "Theil v." or "Th. von" without any postfix,
-        # for example "Theil von 744 A neben 745", "Theil von 126, 124"
-        number_match = re.match(
-            r"^(Th. v.|Theil von|Theil v.|Th. von)\s([0-9]+\s?[a-zA-Z]?(,\s)*)+(\sneben)?\s?[0-9]*\s?[a-zA-Z]?$",
-            old_house_number)
-        if number_match:
-            number_split = re.split(r"Th. v.\s|Theil von\s|Theil v.\s|Th. von\s|\sneben\s|,\s", old_house_number)
-            if re.search(r"neben", old_house_number):
-                number = [number_split[1]]
-                supplement = 'neben'
-                neighbouring_number = number_split[-1]
-            else:
-                number = number_split[1:]
-                supplement = None
-                neighbouring_number = None
-            result = pd.Series([number, supplement, neighbouring_number, True, is_bann])
-            break
-        
-        # Search for numbers with prefix "Th. v.", "Theil von", "Theil v." or "Th. von" and arbitrary postfix,
-        # for example "Theil von 1084, zweites Haus von 1085", "Theil von 552, 551, Vorderhaus"
-        number_match = re.match(r"^(Th. v.|Theil von|Theil v.|Th. von)\s[0-9]+\s?[a-zA-Z]?.+$", old_house_number)
-        if number_match:
-            number_split = re.split(r"Th. v.\s|Theil von\s|Theil v.\s|Th. von\s|,\s|\s", old_house_number)
-
-            # Detect house number postfixes, for example "Theil von 1045 A und B"
-            if len(number_split[2]) == 1 and number_split[2].isalpha():
-                number = [number_split[1] + " " + number_split[2]]
-                supplement_start = re.search(number_split[3], old_house_number).start()
-                supplement = old_house_number[supplement_start:]
-
-            # Detect multiple house numbers, for example "Theil von 552, 551, Hinterhaus"
-            elif number_split[2].isnumeric():
-                number = []
-                index = None
-                for index in range(1, len(number_split)):
-                    if number_split[index].isnumeric():
-                        number.append(number_split[index])
-                    else:
-                        break
-                supplement_start = re.search(number_split[index], old_house_number).start()
-                supplement = old_house_number[supplement_start:]
-
-            else:
-                number_split = re.split(r"Th. v.\s|Theil von\s|Theil v.\s|Th. von\s|,\s|\s", old_house_number, maxsplit=2)
-                number = [number_split[1]]
-                supplement = number_split[2]
-
-            # Search for neighbouring number
+    # Detect old house humbers from "Bann"
+    is_bann = bool(_RE_BANN.search(old_house_number))
+
+    # Detect the format of the old house number in one pass
+    format_match = _RE_OLD_HOUSENUMBER_FORMAT.match(old_house_number)
+    old_house_number_format = format_match.lastgroup if format_match else None
+
+    # Search simple numbers like "1257" and "1257 A" as well as multiple simple numbers
+    # like "1052, 1053, 1054", "1097 / 1096", "827 + 827 A", "1250 u. 1251"
+    if old_house_number_format == 'simple_numbers':
+        number_split = _RE_SIMPLE_NUMBERS_SPLIT.split(old_house_number)
+        return _finalize_split(pd.Series([number_split, None, None, False, is_bann]), new_house_number)
+
+    # Search for numbers with postfix " (Bann)", for example "48 A (Bann)"
+    if old_house_number_format == 'bann_postfix':
+        number_split = _RE_BANN_POSTFIX_SPLIT.split(old_house_number)
+        return _finalize_split(pd.Series([number_split[:-1], None, None, False, is_bann]), new_house_number)
+
+    # Search for numbers with arbitrary postfix, for example "441 A u. Th. v. 440 neben 441 A"
+    if old_house_number_format == 'arbitrary_postfix':
+        number = _RE_ARBITRARY_POSTFIX_NUMBER.search(old_house_number).group()
+        supplement = old_house_number[len(number):]
+        if _RE_TRAILING_SEPARATOR.search(number):
+            number = number[:-1]
+        return _finalize_split(pd.Series([[number], supplement, None, False, is_bann]), new_house_number)
+
+    # Search for numbers with prefix "Th. v.", "Theil von", "Theil v." or "Th. von" without any postfix,
+    # for example "Theil von 744 A neben 745", "Theil von 126, 124"
+    if old_house_number_format == 'part_of':
+        number_split = _RE_PART_OF_SPLIT.split(old_house_number)
+        if _RE_NEBEN.search(old_house_number):
+            number = [number_split[1]]
+            supplement = 'neben'
+            neighbouring_number = number_split[-1]
+        else:
+            number = number_split[1:]
+            supplement = None
             neighbouring_number = None
-            neighbouring_match = re.search(r"^(Th. v.|Theil von|Theil v.|Th. von)\s[0-9]+\s?[a-zA-Z]?\sneben\s[0-9]+",
-                                           old_house_number)
-            if neighbouring_match:
-                neighbouring_split = re.split(r"\s", neighbouring_match.group())
-                neighbouring_number = neighbouring_split[-1]
+        return _finalize_split(pd.Series([number, supplement, neighbouring_number, True, is_bann]), new_house_number)
+
+    # Search for numbers with prefix "Th. v.", "Theil von", "Theil v." or "Th. von" and arbitrary postfix,
+    # for example "Theil von 1084, zweites Haus von 1085", "Theil von 552, 551, Vorderhaus"
+    if old_house_number_format == 'part_of_postfix':
+        number_split = _RE_PART_OF_POSTFIX_SPLIT.split(old_house_number)
+
+        # Detect house number postfixes, for example "Theil von 1045 A und B"
+        if len(number_split[2]) == 1 and number_split[2].isalpha():
+            number = [number_split[1] + " " + number_split[2]]
+            supplement_start = re.search(number_split[3], old_house_number).start()
+            supplement = old_house_number[supplement_start:]
+
+        # Detect multiple house numbers, for example "Theil von 552, 551, Hinterhaus"
+        elif number_split[2].isnumeric():
+            number = []
+            index = None
+            for index in range(1, len(number_split)):
+                if number_split[index].isnumeric():
+                    number.append(number_split[index])
+                else:
+                    break
+            supplement_start = re.search(number_split[index], old_house_number).start()
+            supplement = old_house_number[supplement_start:]
 
-            result =  pd.Series([number, supplement, neighbouring_number, True, is_bann])
-            break
+        else:
+            number_split = _RE_PART_OF_POSTFIX_SPLIT.split(old_house_number, maxsplit=2)
+            number = [number_split[1]]
+            supplement = number_split[2]
 
-        return pd.Series([None, None, None, None, is_bann])
-    
+        # Search for neighbouring number
+        neighbouring_number = None
+        neighbouring_match = _RE_PART_OF_NEIGHBOUR.search(old_house_number)
+        if neighbouring_match:
+            neighbouring_split = _RE_WHITESPACE.split(neighbouring_match.group())
+            neighbouring_number = neighbouring_split[-1]
+
+        return _finalize_split(pd.Series([number, supplement, neighbouring_number, True, is_bann]), new_house_number)
+
+    return pd.Series([None, None, None, None, is_bann])
+
+
+def _finalize_split(result, new_house_number):
     # Test if detected old house number is new house number
     if new_house_number in result[0]:
         return pd.Series([None, 'Log: Alte Hausnummer wurde als neue Hausnummer detektiert. Alte Hausnummer wurde nicht aufbereitet.', None, None, None])
@@ -154,50 +196,94 @@ def split_old_house_number(old_house_number, new_house_number):
         return result
 
 
-def get_first_entry(my_list):
-    try:
-        return my_list[0]
-    except:
-        return None
+def split_old_house_numbers(old_house_numbers, new_house_numbers):
+    """Vectorized version of split_old_house_number for a series of old house numbers and the corresponding
+    series of new house numbers. Returns a dataframe with the same five columns as split_old_house_number.
 
+    Simple numbers like "1052, 1053, 1054" and numbers with postfix " (Bann)" like "48 A (Bann)" are split with
+    pandas string methods. Only the remaining old house numbers are passed to split_old_house_number.
+    """
 
-def correct_old_house_number(dossierid, oldhousenumber_number, oldhousenumber_ispartof,
-                             oldhousenumber_neighbouringnumber, oldhousenumber_supplement,
-                             df_corrections):
-    '''Correct additional oldHousenumber attributes. The following attributes are edited/created:
+    # A column without any old house number is read as float, the string methods need object dtype
+    old_house_numbers = old_house_numbers.astype(object)
+
+    # Fast path for simple numbers and numbers with postfix " (Bann)"
+    is_simple = old_house_numbers.str.match(_RE_SIMPLE_NUMBERS, na=False)
+    is_bann_postfix = ~is_simple & old_house_numbers.str.match(_RE_BANN_POSTFIX, na=False)
+    fast_numbers = pd.concat([old_house_numbers[is_simple].str.split(_RE_SIMPLE_NUMBERS_SPLIT),
+                              old_house_numbers[is_bann_postfix].str.split(_RE_BANN_POSTFIX_SPLIT).str[:-1]])
+
+    # Old house numbers detected as new house number are handled by split_old_house_number
+    is_new = [new_house_number in numbers
+              for numbers, new_house_number in zip(fast_numbers, new_house_numbers[fast_numbers.index])]
+    fast_numbers = fast_numbers[~np.array(is_new, dtype=bool)]
+    result_fast = pd.DataFrame({0: fast_numbers, 1: None, 2: None, 3: False,
+                                4: is_bann_postfix[fast_numbers.index]},
+                               index=fast_numbers.index, dtype=object)
+
+    # All other old house numbers, each distinct pair of old and new house number is only split once
+    is_other = old_house_numbers.notna() & ~old_house_numbers.index.isin(fast_numbers.index)
+    other_pairs = list(zip(old_house_numbers[is_other], new_house_numbers[is_other]))
+    split_pairs = {pair: split_old_house_number(*pair) for pair in dict.fromkeys(other_pairs)}
+    result_other = pd.DataFrame([split_pairs[pair] for pair in other_pairs],
+                                index=old_house_numbers.index[is_other], columns=range(5), dtype=object)
+
+    # Empty old house numbers remain empty
+    result = pd.concat([result_fast, result_other]).reindex(old_house_numbers.index)
+    return result.where(result.notna(), None)
+
+
+def correct_old_house_numbers(dossiers, df_corrections):
+    '''Correct additional oldHousenumber attributes of all dossiers. The following attributes are edited/created:
     - oldHousenumberNumber (replaced)
     - oldHousenumberIsPartOf (replaced)
     - oldHousenumberNeighbouringNumber (replaced)
     - oldHousenumberSupplement (complemented)
     - oldHousenumberIsCorrected (new created)
+    Returns a dataframe with these attributes in the given order and the index of the dossiers.
     '''
-    
-    # Check if dossierId do not exist in correction dataframe
-    if dossierid not in df_corrections['dossierId'].tolist():
-        return pd.Series([oldhousenumber_number, oldhousenumber_ispartof, oldhousenumber_neighbouringnumber, oldhousenumber_supplement, False])
 
-    dossierid_corrections = df_corrections[df_corrections['dossierId']==dossierid]
+    # Parse the corrected old house numbers once per correction instead of once per dossier
+    df_corrections = df_corrections.drop_duplicates('dossierId')
+    df_corrections = df_corrections.assign(
+        oldHouseNumberNumberCorr=df_corrections['oldHouseNumberNumberCorr'].map(literal_eval, na_action='ignore'))
+
+    # Join the corrections to the dossiers, only the first correction per dossierId is used
+    merged = pd.merge(dossiers[['dossierId',
+                                'oldHousenumberNumber',
+                                'oldHousenumberIsPartOf',
+                                'oldHousenumberNeighbouringNumber',
+                                'oldHousenumberSupplement']],
+                      df_corrections, how='left', on='dossierId',
+                      validate='many_to_one')
+    merged.index = dossiers.index
 
     # Replace oldHousenumberNumber if corrected value exist
-    if pd.notnull(dossierid_corrections['oldHouseNumberNumberCorr']).any():
-        oldhousenumber_number = literal_eval(dossierid_corrections['oldHouseNumberNumberCorr'].iloc[0])
+    oldhousenumber_number = merged['oldHouseNumberNumberCorr'].where(
+        merged['oldHouseNumberNumberCorr'].notna(), merged['oldHousenumberNumber'])
 
-    # Replace oldHousenumberIsPartOfCorr if corrected value exist
-    if pd.notnull(dossierid_corrections['oldHousenumberIsPartOfCorr']).any():
-        oldhousenumber_ispartof = dossierid_corrections['oldHousenumberIsPartOfCorr'].iloc[0]
+    # Replace oldHousenumberIsPartOf if corrected value exist
+    oldhousenumber_ispartof = merged['oldHousenumberIsPartOfCorr'].where(
+        merged['oldHousenumberIsPartOfCorr'].notna(), merged['oldHousenumberIsPartOf'])
 
     # Replace oldHousenumberNeighbouringNumber if corrected value exist
-    if pd.notnull(dossierid_corrections['oldHousenumberNeighbouringNumberCorr']).any():
-        oldhousenumber_neighbouringnumber = dossierid_corrections['oldHousenumberNeighbouringNumberCorr'].iloc[0]
+    oldhousenumber_neighbouringnumber = merged['oldHousenumberNeighbouringNumberCorr'].where(
+        merged['oldHousenumberNeighbouringNumberCorr'].notna(), merged['oldHousenumberNeighbouringNumber'])
 
     # Complement oldHousenumberSupplement if corrected value exist
-    if pd.notnull(dossierid_corrections['oldHousenumberSupplementAddition']).any():
-        if pd.isna(oldhousenumber_supplement):
-            oldhousenumber_supplement = 'manuell erfasste Bemerkung: ' + dossierid_corrections['oldHousenumberSupplementAddition'].iloc[0]
-        else:
-            oldhousenumber_supplement += ' , zusätzliche manuell erfasste Bemerkung: ' + dossierid_corrections['oldHousenumberSupplementAddition'].iloc[0]
+    supplement = merged['oldHousenumberSupplement']
+    addition = merged['oldHousenumberSupplementAddition']
+    oldhousenumber_supplement = supplement.where(
+        addition.isna(),
+        np.where(supplement.isna(),
+                 'manuell erfasste Bemerkung: ' + addition,
+                 supplement + ' , zusätzliche manuell erfasste Bemerkung: ' + addition))
 
-    return pd.Series([oldhousenumber_number, oldhousenumber_ispartof, oldhousenumber_neighbouringnumber, oldhousenumber_supplement, True])
+    return pd.DataFrame({'oldHousenumberNumber': oldhousenumber_number,
+                         'oldHousenumberIsPartOf': oldhousenumber_ispartof,
+                         'oldHousenumberNeighbouringNumber': oldhousenumber_neighbouringnumber,
+                         'oldHousenumberSupplement': oldhousenumber_supplement,
+                         'oldHousenumberIsCorrected': dossiers['dossierId'].isin(df_corrections['dossierId'])})
 
 
 if __name__ == "__main__":
@@ -206,15 +292,15 @@ if __name__ == "__main__":
     all_dossiers = pd.read_csv('data/stabs_dossier.csv')
 
     # Identify first new house number based on the title of the dossier
-    all_dossiers['housenumberFromTitle'] = all_dossiers.apply(lambda row: get_new_house_number(row['title']), axis=1)
+    all_dossiers['housenumberFromTitle'] = get_new_house_numbers(all_dossiers['title'])
 
     # Create additional attributes based on the old house number and check for new house numbers
     all_dossiers[['oldHousenumberNumber',
                   'oldHousenumberSupplement',
                   'oldHousenumberNeighbouringNumber',
                   'oldHousenumberIsPartOf',
-                  'oldHousenumberIsBann']] = all_dossiers.apply(
-        lambda row: split_old_house_number(row['oldHousenumber'], row['housenumberFromTitle']), axis=1)
+                  'oldHousenumberIsBann']] = split_old_house_numbers(all_dossiers['oldHousenumber'],
+                                                                     all_dossiers['housenumberFromTitle'])
     
     # Correct additional oldHousenumber attributes based on the manually created file oldHousenumberCorrections.csv
     corrections = pd.read_csv('oldHousenumberCorrections.csv')
@@ -223,18 +309,10 @@ if __name__ == "__main__":
                   'oldHousenumberIsPartOf',
                   'oldHousenumberNeighbouringNumber',
                   'oldHousenumberSupplement',
-                  'oldHousenumberIsCorrected']] = all_dossiers.apply(
-        lambda row: correct_old_house_number(dossierid=row['dossierId'],
-                                             oldhousenumber_number=row['oldHousenumberNumber'],
-                                             oldhousenumber_ispartof=row['oldHousenumberIsPartOf'],
-                                             oldhousenumber_neighbouringnumber=row['oldHousenumberNeighbouringNumber'],
-                                             oldhousenumber_supplement=row['oldHousenumberSupplement'],
-                                             df_corrections=corrections),
-                                             axis=1)
+                  'oldHousenumberIsCorrected']] = correct_old_house_numbers(all_dossiers, corrections)
 
     # Create a new attribut storing the first extracted old house number
-    all_dossiers['oldHousenumberNumberFirst'] = all_dossiers.apply(
-        lambda row: get_first_entry(row['oldHousenumberNumber']), axis=1)
+    all_dossiers['oldHousenumberNumberFirst'] = all_dossiers['oldHousenumberNumber'].str[0]
 
     # Join the series to the dossier
     dossiers_serie = pd.merge(all_dossiers, series_data, how='left', on='serieId', suffixes=('', '_serie'),
@@ -243,4 +321,6 @@ if __name__ == "__main__":
     # Write the data created
     today = datetime.today()
     dossiers_serie.to_csv("data/" + today.strftime("%Y%m%d") + "_hgb_metadaten.csv", index=False, header=True)
-    dossiers_serie.to_json("data/" + today.strftime("%Y%m%d") + "_hgb_metadaten.json", orient='records', lines=True)
+    with open("data/" + today.strftime("%Y%m%d") + "_hgb_metadaten.json", 'wb') as file:
+        for record in dossiers_serie.to_dict(orient='records'):
+            file.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY))
@@ -5,11 +5,263 @@ available in the Linked Open Data Portal of the State Archives Basel-Stadt.
 """
 
 
-from SPARQLWrapper import SPARQLWrapper, JSON
 import pandas as pd
 import re
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+import concurrent.futures
+import functools
+import orjson
+import os
+import time
+import gzip
+import hashlib
+import tempfile
+import io
+
+
+logger = logging.getLogger(__name__)
+
+# SPARQL endpoint of the Linked Open Data portal.
+_SPARQL_ENDPOINT = "https://ld.bs.ch/query/"
+
+# Directory to cache SPARQL responses on disk. Caching is enabled by setting
+# SPARQL_CACHE_TTL to the number of seconds a cached response remains valid.
+SPARQL_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache',
+                                'hgb_sparql')
+SPARQL_CACHE_TTL = 0
+
+# Session to reuse connections for requests to the Linked Open Data portal.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_maxsize=32))
+
+# Maximum number of results per request, larger results are queried in pages.
+SPARQL_PAGE_SIZE = 10000
+
+# Parts of the serie and dossier identifiers used for the project ids, e.g.
+# "HGB 1 91" and "HGB 1 91/113".
+_RE_SERIE_IDENTIFIER = re.compile(
+    r'^[^ ]* ([^ ]*) [^\S ]*([0-9]+)[^\S ]*(?: |$)')
+_RE_DOSSIER_IDENTIFIER = re.compile(
+    r'^[\s/]*[^\s/]+[\s/]+([^\s/]+)[\s/]+([0-9]+)[\s/]+([0-9]+)(?:[\s/]|$)')
+_SLASH_TO_SPACE = str.maketrans('/', ' ')
+
+# Query variables of dossiers and the corresponding column names.
+_DOSSIER_COLUMNS = {'identifier': 'stabsId',
+                    'title': 'title',
+                    'housenamebs': 'houseName',
+                    'oldhousenumber': 'oldHousenumber',
+                    'owner1862': 'owner1862',
+                    'note': 'descriptiveNote',
+                    'link': 'link'}
+
+# Columns of dossiers queried without details.
+_DOSSIER_CORE_COLUMNS = ['stabsId', 'title', 'link']
+
+# Stable order of the dossier query results, see _query_bindings().
+_DOSSIERS_ORDER = ('?serie ?link ?identifier ?title ?note ?housenamebs '
+                   '?oldhousenumber ?owner1862')
+_DOSSIERS_CORE_ORDER = '?serie ?link ?identifier ?title'
+_DOSSIER_DETAILS_ORDER = '?link ?note ?housenamebs ?oldhousenumber ?owner1862'
+
+# SPARQL queries. Placeholders of the form @@NAME@@ are replaced by the query
+# parameters, such that the braces of the queries need no escaping.
+_SERIES_QUERY = """
+    PREFIX rico: <https://www.ica.org/standards/RiC/ontology#>
+    SELECT ?link ?identifier ?title
+    WHERE {
+        {
+        ?link rico:identifier ?identifier ;
+        rico:title ?title ;
+        rico:type "Akte"@ger ;
+        rico:isIncludedInTransitive <https://ld.bs.ch/ais/Record/1027330> .
+        }
+    }
+    """
+
+_DOSSIERS_QUERY = """
+    PREFIX rico: <https://www.ica.org/standards/RiC/ontology#>
+    PREFIX stabs-rico:
+        <https://ld.bs.ch/ontologies/StABS-RiC/>
+    SELECT ?serie ?link ?identifier ?title ?note ?housenamebs
+        ?oldhousenumber ?owner1862
+        WHERE {
+                VALUES ?serie { @@SERIES@@ }
+                {
+                ?link rico:identifier ?identifier ;
+                rico:title ?title ;
+                rico:type "Akte"@ger ;
+                rico:isIncludedInTransitive ?serie .
+                }
+            OPTIONAL {?link rico:generalDescription ?note .}
+            OPTIONAL {?link stabs-rico:houseNameBS ?housenamebs .}
+            OPTIONAL {?link stabs-rico:oldHousenumber ?oldhousenumber .}
+            OPTIONAL {?link stabs-rico:owner1862 ?owner1862 .}
+        }
+    """
+
+_DOSSIERS_CORE_QUERY = """
+    PREFIX rico: <https://www.ica.org/standards/RiC/ontology#>
+    SELECT ?serie ?link ?identifier ?title
+        WHERE {
+                VALUES ?serie { @@SERIES@@ }
+                ?link rico:identifier ?identifier ;
+                rico:title ?title ;
+                rico:type "Akte"@ger ;
+                rico:isIncludedInTransitive ?serie .
+        }
+    """
+
+_DOSSIER_DETAILS_QUERY = """
+    PREFIX rico: <https://www.ica.org/standards/RiC/ontology#>
+    PREFIX stabs-rico:
+        <https://ld.bs.ch/ontologies/StABS-RiC/>
+    SELECT ?link ?note ?housenamebs ?oldhousenumber ?owner1862
+        WHERE {
+                VALUES ?link { @@DOSSIERS@@ }
+            OPTIONAL {?link rico:generalDescription ?note .}
+            OPTIONAL {?link stabs-rico:houseNameBS ?housenamebs .}
+            OPTIONAL {?link stabs-rico:oldHousenumber ?oldhousenumber .}
+            OPTIONAL {?link stabs-rico:owner1862 ?owner1862 .}
+        }
+    """
+
+_DOCUMENTS_QUERY = """
+    PREFIX rico: <https://www.ica.org/standards/RiC/ontology#>
+    SELECT ?link ?identifier ?title ?type ?descriptivenote
+        ?isassociatedwithdate
+        WHERE {
+                {
+                ?link rico:identifier ?identifier ;
+                rico:title ?title ;
+                rico:type ?type ;
+                rico:isIncludedInTransitive <@@SERIE@@> .
+                }
+            OPTIONAL {?link rico:generalDescription ?descriptivenote .}
+            OPTIONAL {?link rico:isAssociatedWithDate
+                ?isassociatedwithdate .}
+        }
+    """
+
+
+def _query(query, result_format):
+    """Run a SPARQL query and return the raw response.
+    The query is sent as POST request over the shared session, such that
+    connections are kept alive between queries and long queries are possible.
+    If SPARQL_CACHE_TTL is set, responses are cached in SPARQL_CACHE_DIR.
+
+    Args:
+        query (str): SPARQL query.
+        result_format (str): Media type of the requested result format.
+
+    Returns:
+        bytes: Body of the response.
+    """
+    cache_file = None
+    if SPARQL_CACHE_TTL:
+        key = hashlib.blake2b(f'{result_format}\n{query}'.encode(),
+                              digest_size=16).hexdigest()
+        cache_file = os.path.join(SPARQL_CACHE_DIR, f'{key}.gz')
+        if os.path.exists(cache_file) and \
+                time.time() - os.path.getmtime(cache_file) < SPARQL_CACHE_TTL:
+            with gzip.open(cache_file, 'rb') as f:
+                return f.read()
+
+    r = _SESSION.post(_SPARQL_ENDPOINT,
+                      data={'query': query},
+                      headers={'Accept': result_format}
+                      )
+    r.raise_for_status()
+
+    if cache_file:
+        # Write to a temporary file first, such that concurrent queries never
+        # read an incomplete cache file.
+        os.makedirs(SPARQL_CACHE_DIR, exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(dir=SPARQL_CACHE_DIR)
+        try:
+            with os.fdopen(fd, 'wb') as raw, \
+                    gzip.GzipFile(fileobj=raw, mode='wb') as f:
+                f.write(r.content)
+            os.replace(tmp_file, cache_file)
+        except BaseException:
+            os.unlink(tmp_file)
+            raise
+    return r.content
+
+
+def _query_json(query):
+    """Run a SPARQL query and decode the JSON response with orjson.
+    Args:
+        query (str): SPARQL query.
+
+    Returns:
+        dict: Decoded query result.
+    """
+    return orjson.loads(_query(query, 'application/sparql-results+json'))
+
+
+def _query_pages(query, order_by, read_page):
+    """Run a SPARQL query page by page and yield the results of each page.
+    The results are ordered by the given variables and requested in pages of
+    SPARQL_PAGE_SIZE results, until a page is not completely filled.
+
+    Args:
+        query (str): SPARQL SELECT query without solution modifiers.
+        order_by (str): Variables defining a stable order of the results.
+        read_page (function): Runs the query of a page and returns its
+            results.
+
+    Yields:
+        list or DataFrame: Results of a page as returned by read_page.
+    """
+    offset = 0
+    while True:
+        page = read_page(f'{query}ORDER BY {order_by}\n'
+                         f'LIMIT {SPARQL_PAGE_SIZE}\nOFFSET {offset}\n'
+                         )
+        yield page
+        if len(page) < SPARQL_PAGE_SIZE:
+            return
+        offset += SPARQL_PAGE_SIZE
+
+
+def _query_bindings(query, order_by):
+    """Run a SPARQL query page by page and yield the bindings of each page.
+    Args:
+        query (str): SPARQL SELECT query without solution modifiers.
+        order_by (str): Variables defining a stable order of the results.
+
+    Yields:
+        list: Result bindings of a page.
+    """
+    return _query_pages(query, order_by,
+                        lambda q: _query_json(q)["results"]["bindings"])
+
+
+def _read_csv_page(query):
+    """Run a SPARQL query and read the CSV response into a dataframe."""
+    return pd.read_csv(io.BytesIO(_query(query, 'text/csv')),
+                       dtype=str, keep_default_na=False)
+
+
+def _query_table(query, order_by):
+    """Run a SPARQL query page by page with results in CSV format.
+    Compared to JSON, the CSV results are smaller and are read into a
+    dataframe without creating a Python object per binding. CSV does not
+    distinguish unbound variables from empty literals, hence both are
+    returned as None.
+
+    Args:
+        query (str): SPARQL SELECT query without solution modifiers.
+        order_by (str): Variables defining a stable order of the results.
+
+    Returns:
+        DataFrame: Query results, unbound values and empty literals are None.
+    """
+    table = pd.concat(_query_pages(query, order_by, _read_csv_page),
+                      ignore_index=True)
+    return table.where(table != '', None)
 
 
 def query_series():
@@ -20,31 +272,11 @@ def query_series():
     Returns:
         list: Metadata of series from the HGB1.
     """
-    sparql = SPARQLWrapper("https://ld.bs.ch/query/")
-    sparql.setReturnFormat(JSON)
-    sparql.setQuery("""
-        PREFIX rico: <https://www.ica.org/standards/RiC/ontology#>
-        SELECT ?link ?identifier ?title
-        WHERE {
-            {
-            ?link rico:identifier ?identifier ;
-            rico:title ?title ;
-            rico:type "Akte"@ger ;
-            rico:isIncludedInTransitive <https://ld.bs.ch/ais/Record/1027330> .
-            }
-        }
-        """
-                    )
-    ret = sparql.queryAndConvert()
+    ret = _query_json(_SERIES_QUERY)
 
     # Store the data as transformed list.
-    series_list = []
-    for r in ret["results"]["bindings"]:
-        serie = {}
-        for key, val in r.items():
-            serie[key] = val["value"]
-        series_list.append(serie)
-    return series_list
+    return [{key: val["value"] for key, val in r.items()}
+            for r in ret["results"]["bindings"]]
 
 
 def get_series(series_data):
@@ -55,14 +287,9 @@ def get_series(series_data):
     Returns:
         DataFrame: Table of series metadata.
     """
-    df_series = pd.DataFrame(columns=['stabsId', 'title', 'link'])
-    for serie in series_data:
-        df_serie = pd.DataFrame({'stabsId': [serie['identifier']],
-                                 'title': [serie['title']],
-                                 'link': [serie['link']]}
-                                )
-        df_series = pd.concat([df_series, df_serie], ignore_index=True)
-    return df_series
+    return pd.DataFrame.from_records(
+        series_data, columns=['identifier', 'title', 'link']
+        ).rename(columns={'identifier': 'stabsId'})
 
 
 def get_serie_id(identifier):
@@ -78,89 +305,213 @@ def get_serie_id(identifier):
     return identifier
 
 
-def query_dossiers(link_serie):
+def get_serie_ids(identifiers):
+    """Vectorized version of get_serie_id() for several series.
+    Args:
+        identifiers (Series): Identifiers of the series.
+
+    Returns:
+        Series: Project ids of the series, NaN for identifiers of unexpected
+        format.
+    """
+    parts = identifiers.str.extract(_RE_SERIE_IDENTIFIER)
+    return 'HGB_' + parts[0] + '_' + _format_number(parts[1])
+
+
+def _format_number(numbers):
+    """Format a series of digit strings like int() with three digits."""
+    return numbers.str.lstrip('0').str.zfill(3)
+
+
+def query_dossiers(link_serie, with_details=True):
     """Given a serie URI, all connected dossier where queried.
+    The same VALUES query as in query_all_dossiers() is used, such that the
+    query structure is identical for all series.
+
     Args:
         link_serie (str): URI of a serie.
+        with_details (bool): If False, only the identifier, title and link of
+            the dossiers are queried.
 
     Returns:
         list or None: Metadata of connected dossiers.
     """
-    sparql = SPARQLWrapper("https://ld.bs.ch/query/")
-    sparql.setReturnFormat(JSON)
-    sparql.setQuery("""
-        PREFIX rico: <https://www.ica.org/standards/RiC/ontology#>
-        PREFIX stabs-rico:
-            <https://ld.bs.ch/ontologies/StABS-RiC/>
-        SELECT ?link ?identifier ?title ?note ?housenamebs ?oldhousenumber
-            ?owner1862
-            WHERE {{
-                    {{
-                    ?link rico:identifier ?identifier ;
-                    rico:title ?title ;
-                    rico:type "Akte"@ger ;
-                    rico:isIncludedInTransitive <{}> .
-                    }}
-                OPTIONAL {{?link rico:generalDescription ?note .}}
-                OPTIONAL {{?link stabs-rico:houseNameBS ?housenamebs .}}
-                OPTIONAL {{?link stabs-rico:oldHousenumber ?oldhousenumber .}}
-                OPTIONAL {{?link stabs-rico:owner1862 ?owner1862 .}}
-            }}
-            """.format(link_serie)
-                    )
-    ret = sparql.queryAndConvert()
-
-    if not ret["results"]["bindings"]:
-        logging.warning('For the following serie, no dossier was found: '
-                        f'{link_serie}.'
-                        )
-        return None
+    return query_all_dossiers([link_serie], with_details).get(link_serie)
+
+
+def query_dossiers_core(link_serie):
+    """Given a serie URI, the identifier, title and link of all connected
+    dossiers where queried. Details of selected dossiers can be queried
+    afterwards with query_dossier_details().
+
+    Args:
+        link_serie (str): URI of a serie.
+
+    Returns:
+        list or None: Core metadata of connected dossiers.
+    """
+    return query_dossiers(link_serie, with_details=False)
+
+
+def query_dossier_details(links_dossier):
+    """Given several dossier URIs, the optional attributes where queried.
+    The attributes are the descriptive note, house name, old house number
+    and owner in 1862.
+
+    Args:
+        links_dossier (list): URIs of the dossiers.
+
+    Returns:
+        list: Details of the dossiers, each including the key 'link'.
+    """
+    query = _DOSSIER_DETAILS_QUERY.replace(
+        '@@DOSSIERS@@', ' '.join(f'<{link}>' for link in links_dossier))
+
+    # Store the data as transformed list.
+    return [{key: val["value"] for key, val in r.items()}
+            for bindings in _query_bindings(query, _DOSSIER_DETAILS_ORDER)
+            for r in bindings]
+
+
+def query_all_dossiers(links_serie, with_details=True):
+    """Given several serie URIs, all connected dossiers where queried at once.
+    The series are passed to the endpoint in a VALUES clause, such that only
+    one request is needed for all of them.
+
+    Args:
+        links_serie (list): URIs of the series.
+        with_details (bool): If False, only the identifier, title and link of
+            the dossiers are queried.
+
+    Returns:
+        dict: Metadata of connected dossiers per serie URI. Series without
+        dossiers are not included.
+    """
+    # Store the data as transformed list per serie.
+    dossiers = {}
+    for bindings in _query_bindings(*_dossiers_query(links_serie,
+                                                     with_details)):
+        for r in bindings:
+            dossiers.setdefault(r['serie']['value'], []).append(
+                {key: val["value"] for key, val in r.items()})
+
+    _warn_missing_series(links_serie, dossiers)
+    return dossiers
+
+
+def _dossiers_query(links_serie, with_details=True):
+    """Create the query of all dossiers connected to the given serie URIs.
+    Returns the query and the variables defining the order of its results.
+    """
+    if with_details:
+        query, order_by = _DOSSIERS_QUERY, _DOSSIERS_ORDER
     else:
-        # Store the data as transformed list.
-        dossiers = []
-        for r in ret["results"]["bindings"]:
-            dossier = {}
-            for key, val in r.items():
-                dossier[key] = val["value"]
-            dossiers.append(dossier)
-        return dossiers
+        query, order_by = _DOSSIERS_CORE_QUERY, _DOSSIERS_CORE_ORDER
+    return (query.replace('@@SERIES@@',
+                          ' '.join(f'<{link}>' for link in links_serie)),
+            order_by)
+
 
+def _warn_missing_series(links_serie, found_series):
+    """Log a warning for each serie URI without dossiers."""
+    for link_serie in links_serie:
+        if link_serie not in found_series:
+            logger.warning('For the following serie, no dossier was found: '
+                           '%s.', link_serie
+                           )
 
-def get_dossiers(link_serie):
+
+def get_dossiers(link_serie, with_details=True):
     """ Get all relevant dossier information.
     Given a serie URI, all information of interest from the connected dossiers
     where queried.
 
     Args:
         link_serie (str): URI of a serie.
+        with_details (bool): If False, only the columns 'stabsId', 'title' and
+            'link' are queried, which is considerably faster.
 
     Returns:
         DataFrame or None: Metadata of connected dossiers.
     """
-    dossiers = query_dossiers(link_serie)
+    dossiers = query_dossiers(link_serie, with_details)
     if dossiers:
-        df_dossiers = pd.DataFrame(
-            columns=['stabsId', 'title', 'houseName', 'oldHousenumber',
-                     'owner1862', 'descriptiveNote', 'link']
-                     )
-        for dossier in dossiers:
-            df_dossier = pd.DataFrame(
-                {'stabsId': [dossier.get('identifier')],
-                 'title': [dossier.get('title')],
-                 'houseName': [dossier.get('housenamebs')],
-                 'oldHousenumber': [dossier.get('oldhousenumber')],
-                 'owner1862': [dossier.get('owner1862')],
-                 'descriptiveNote': [dossier.get('note')],
-                 'link': [dossier.get('link')]
-                 })
-            df_dossiers = pd.concat([df_dossiers, df_dossier],
-                                    ignore_index=True
-                                    )
-        return df_dossiers
+        df_dossiers = dossiers_to_dataframe(dossiers)
+        return df_dossiers if with_details \
+            else df_dossiers[_DOSSIER_CORE_COLUMNS]
     else:
         return None
 
 
+def dossiers_to_dataframe(dossiers):
+    """Extract the dossier attributes of interest into a dataframe.
+    Args:
+        dossiers (list): List of dossier metadata created by query_dossiers()
+            or query_all_dossiers().
+
+    Returns:
+        DataFrame: Table of dossier metadata.
+    """
+    df_dossiers = pd.DataFrame.from_records(
+        dossiers, columns=list(_DOSSIER_COLUMNS)
+        ).rename(columns=_DOSSIER_COLUMNS)
+
+    # Missing optional attributes are stored as None.
+    return df_dossiers.astype(object).where(df_dossiers.notna(), None)
+
+
+def get_all_dossiers(series_data, max_workers=16, batch_size=None,
+                     with_details=True):
+    """Get all relevant dossier information of several series.
+    By default, all series are queried in a single request. The results are
+    requested in CSV format and read directly into a dataframe, where empty
+    literals are returned as None like missing attributes. For endpoints
+    limiting the query length, the series can be split into batches, which
+    are queried concurrently.
+
+    Args:
+        series_data (DataFrame): Series with the columns 'link' and 'serieId'.
+        max_workers (int): Maximum number of concurrent queries.
+        batch_size (int or None): Number of series per query. If None, all
+            series are queried at once.
+        with_details (bool): If False, only the columns 'stabsId', 'title' and
+            'link' are queried, which is considerably faster.
+
+    Returns:
+        DataFrame or None: Metadata of all connected dossiers including the
+        column 'serieId'.
+    """
+    links_serie = list(dict.fromkeys(series_data['link'].tolist()))
+    if not links_serie:
+        return None
+    batch_size = batch_size or len(links_serie)
+    batches = [links_serie[i:i + batch_size]
+               for i in range(0, len(links_serie), batch_size)]
+    tables = []
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers) as executor:
+        futures = [executor.submit(_query_table,
+                                   *_dossiers_query(batch, with_details))
+                   for batch in batches]
+        for future in concurrent.futures.as_completed(futures):
+            tables.append(future.result())
+    dossiers = pd.concat(tables, ignore_index=True, copy=False)
+    _warn_missing_series(links_serie, set(dossiers['serie']))
+    if dossiers.empty:
+        return None
+
+    # Join the dossiers to the series, keeping the order of the series.
+    df_dossiers = pd.merge(
+        series_data[['link', 'serieId']].rename(columns={'link': 'serie'}),
+        dossiers, how='inner', on='serie'
+        )
+    if df_dossiers.empty:
+        return None
+    columns = list(_DOSSIER_COLUMNS.values()) if with_details \
+        else _DOSSIER_CORE_COLUMNS
+    return df_dossiers.rename(columns=_DOSSIER_COLUMNS)[columns + ['serieId']]
+
+
 def get_dossier_id(identifier):
     """ Based on the identifier of the dossier, create the project id.
     Args:
@@ -169,12 +520,26 @@ def get_dossier_id(identifier):
     Returns:
         str: Project id of the dossier.
     """
-    identifier_split = re.split(r'\s+|/', identifier)
+    identifier_split = identifier.translate(_SLASH_TO_SPACE).split()
     id = f'HGB_{identifier_split[1]}_{int(identifier_split[2]):03}_'\
         f'{int(identifier_split[3]):03}'
     return id
 
 
+def get_dossier_ids(identifiers):
+    """Vectorized version of get_dossier_id() for several dossiers.
+    Args:
+        identifiers (Series): Identifiers of the dossiers.
+
+    Returns:
+        Series: Project ids of the dossiers, NaN for identifiers of unexpected
+        format.
+    """
+    parts = identifiers.str.extract(_RE_DOSSIER_IDENTIFIER)
+    return 'HGB_' + parts[0] + '_' + _format_number(parts[1]) + '_' + \
+        _format_number(parts[2])
+
+
 def query_documents(link_serie):
     """Given a serie URI, all connected documents where queried.
     The query parameters of this function is optimized to query all documents
@@ -187,58 +552,58 @@ def query_documents(link_serie):
     Returns:
         list or None: Metadata of connected documents.
     """
-    sparql = SPARQLWrapper("https://ld.bs.ch/query/")
-    sparql.setReturnFormat(JSON)
-    sparql.setQuery("""
-        PREFIX rico: <https://www.ica.org/standards/RiC/ontology#>
-        SELECT ?link ?identifier ?title ?type ?descriptivenote
-            ?isassociatedwithdate
-            WHERE {{
-                    {{
-                    ?link rico:identifier ?identifier ;
-                    rico:title ?title ;
-                    rico:type ?type ;
-                    rico:isIncludedInTransitive <{}> .
-                    }}
-                OPTIONAL {{?link rico:generalDescription ?descriptivenote .}}
-                OPTIONAL {{?link rico:isAssociatedWithDate
-                    ?isassociatedwithdate .}}
-            }}
-            """.format(link_serie)
-                    )
-    ret = sparql.queryAndConvert()
-
-    if not ret["results"]["bindings"]:
-        logging.warning('For the following serie, no dossier was found: '
-                        f'{link_serie}.'
-                        )
+    ret = _query_json(_DOCUMENTS_QUERY.replace('@@SERIE@@', link_serie))
+    bindings = ret["results"]["bindings"]
+
+    if not bindings:
+        logger.warning('For the following serie, no dossier was found: '
+                       '%s.', link_serie
+                       )
         return None
     else:
         # Store the data as transformed list.
-        dossiers = []
-        for r in ret["results"]["bindings"]:
-            dossier = {}
-            for key, val in r.items():
-                dossier[key] = val["value"]
-            dossiers.append(dossier)
-        return dossiers
+        return [{key: val["value"] for key, val in r.items()}
+                for r in bindings]
+
+
+@functools.lru_cache(maxsize=100_000)
+def _query_date(link_date):
+    """Query the expressed date of an associated date record.
+    The result is cached, since many documents refer to the same date record.
+    Failed requests raise an exception and are therefore not cached.
+
+    Args:
+        link_date (str): URI of a associated date record.
+
+    Returns:
+        str: Associated date.
+
+    Raises:
+        requests.HTTPError: If the date record could not be retrieved.
+    """
+    r = _SESSION.get(link_date + '?format=jsonld')
+    if r.status_code != requests.codes.ok:
+        raise requests.HTTPError(response=r)
+    return r.json()[
+        'https://www.ica.org/standards/RiC/ontology#expressedDate'
+        ]
 
 
 def get_date(link_date):
     """Given the URI of a associated date, the expressed date is returned.
+    Successful lookups are cached, see _query_date().
+
     Args:
         link_serie (str): URI of a associated date record.
 
     Returns:
         str or None: Associated date (if available).
     """
-    r = requests.get(link_date + '?format=jsonld')
-    if r.status_code == requests.codes.ok:
-        return r.json()[
-            'https://www.ica.org/standards/RiC/ontology#expressedDate'
-            ]
-    else:
-        logging.warning('No associated date record found for '
-                        f'{link_date}. Return: {r.text} ({r}).'
-                        )
+    try:
+        return _query_date(link_date)
+    except requests.HTTPError as e:
+        logger.warning('No associated date record found for '
+                       '%s. Return: %s (%s).', link_date, e.response.text,
+                       e.response
+                       )
         return None